@@ -1,3 +1,4 @@
+import numpy as np
 import shapely.geometry as sgeom
 
 '''
@@ -39,12 +40,13 @@ def find_side(line_string: sgeom.LineString, side: str) -> sgeom.LineString:
     # Extract the bounds of the LineString
     minx, miny, maxx, maxy = line_string.bounds
 
-    # Define the coordinates for each side of the rectangle
+    # Define the coordinates for each side of the rectangle; numpy arrays feed
+    # shapely 2.x's vectorized constructor without Python-level tuple packing
     side_points = {
-        'left': [(minx, miny), (minx, maxy)],
-        'right': [(maxx, miny), (maxx, maxy)],
-        'bottom': [(minx, miny), (maxx, miny)],
-        'top': [(minx, maxy), (maxx, maxy)],
+        'left': np.array([[minx, miny], [minx, maxy]]),
+        'right': np.array([[maxx, miny], [maxx, maxy]]),
+        'bottom': np.array([[minx, miny], [maxx, miny]]),
+        'top': np.array([[minx, maxy], [maxx, maxy]]),
     }
 
     # Return the corresponding side as a LineString
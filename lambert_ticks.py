@@ -1,10 +1,106 @@
+import functools
+
 import numpy as np
 import cartopy.crs as ccrs
+import pyproj
+import shapely
 import shapely.geometry as sgeom
+from shapely.prepared import prep
 from typing import List, Tuple
 from find_side import *
 
-def _lambert_ticks(ax, ticks: List[float], tick_location: str, line_constructor, tick_extractor) -> Tuple[List[float], List[float]]:
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional: without it the batch builder runs as plain numpy,
+    # which is already vectorized per tick line
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+@functools.lru_cache(maxsize=32)
+def _get_transformer(src_crs_wkt: str, dst_crs_wkt: str) -> pyproj.Transformer:
+    """
+    Return a cached pyproj Transformer between two coordinate reference systems.
+
+    Parameters
+    ----------
+    src_crs_wkt : str
+        WKT representation of the source CRS.
+    dst_crs_wkt : str
+        WKT representation of the destination CRS.
+
+    Returns
+    -------
+    pyproj.Transformer
+        A transformer converting (x, y) coordinates from the source to the
+        destination CRS.
+
+    Notes
+    -----
+    Building a Transformer involves an expensive PROJ setup (~2 ms), so the
+    result is cached on the CRS pair and reused across tick computations.
+    """
+    return pyproj.Transformer.from_crs(src_crs_wkt, dst_crs_wkt, always_xy=True)
+
+def get_transformer(src_crs: ccrs.CRS, dst_crs: ccrs.CRS) -> pyproj.Transformer:
+    """
+    Return the shared cached Transformer between two cartopy CRS objects.
+
+    Parameters
+    ----------
+    src_crs : ccrs.CRS
+        The source coordinate reference system.
+    dst_crs : ccrs.CRS
+        The destination coordinate reference system.
+
+    Returns
+    -------
+    pyproj.Transformer
+        The cached transformer for this CRS pair; repeated calls with the
+        same pair (e.g. PlateCarree -> the figure projection for both
+        subplots) reuse one Transformer instead of rebuilding it.
+    """
+    return _get_transformer(src_crs.to_wkt(), dst_crs.to_wkt())
+
+@njit(cache=True)
+def _build_tick_lines(ticks: np.ndarray, extent: np.ndarray, n_steps: int, vertical: bool) -> np.ndarray:
+    """
+    Build the geodetic coordinate lines for a batch of ticks.
+
+    Parameters
+    ----------
+    ticks : np.ndarray
+        The tick values (longitudes for vertical lines, latitudes otherwise).
+
+    extent : np.ndarray
+        The (x0, x1, y0, y1) geodetic extent of the axes.
+
+    n_steps : int
+        Number of sample points along each line.
+
+    vertical : bool
+        If True, build constant-longitude lines spanning the latitude range;
+        otherwise build constant-latitude lines spanning the longitude range.
+
+    Returns
+    -------
+    np.ndarray
+        A contiguous (len(ticks), n_steps, 2) array of lon/lat coordinates,
+        ready for one batched projection call.
+    """
+    lines = np.empty((len(ticks), n_steps, 2))
+    for i in range(len(ticks)):
+        if vertical:
+            lines[i, :, 0] = ticks[i]
+            lines[i, :, 1] = np.linspace(extent[2], extent[3], n_steps)
+        else:
+            lines[i, :, 0] = np.linspace(extent[0], extent[1], n_steps)
+            lines[i, :, 1] = ticks[i]
+    return lines
+
+def _lambert_ticks(ax, ticks: List[float], tick_location: str, vertical: bool, tick_extractor) -> Tuple[List[float], List[float]]:
     """
     Get the tick locations and labels for an axis of a Lambert Conformal projection.
 
@@ -19,13 +115,13 @@ def _lambert_ticks(ax, ticks: List[float], tick_location: str, line_constructor,
     tick_location : str
         The location of the ticks on the axis. Can be either 'left' or 'bottom'.
     
-    line_constructor : callable
-        A function that generates a line of coordinates given a tick position. 
-        It takes a tick value and returns a line (array of coordinates) on the projection.
+    vertical : bool
+        Whether the tick lines run along constant longitude (True, x-axis
+        ticks) or constant latitude (False, y-axis ticks).
 
     tick_extractor : callable
-        A function that extracts tick locations from the intersection points of the line and the projection boundary.
-        It takes the intersection points as input and returns the tick locations.
+        A function that extracts the tick location from the intersection points of the line and the projection boundary.
+        It takes the (N, 2) coordinate array of the intersection and returns the tick location.
 
     Returns
     -------
@@ -44,37 +140,64 @@ def _lambert_ticks(ax, ticks: List[float], tick_location: str, line_constructor,
     if tick_location not in valid_locations:
         raise ValueError(f"Invalid tick_location: {tick_location}. Must be one of {valid_locations}.")
 
-    # Extract the boundary of the axes (bounding box) in geodetic coordinates
-    outline_patch = sgeom.LineString(ax.spines['geo'].get_path().vertices.tolist())
-    axis = find_side(outline_patch, tick_location)
-    
+    # Build the axes outline directly from the projected extent; unlike the
+    # geo spine path this needs no canvas draw to be populated. The requested
+    # side is cached per axes, keyed on the extent so changed limits
+    # invalidate stale entries.
+    cache = getattr(ax, '_lambert_axis_cache', None)
+    if cache is None:
+        cache = ax._lambert_axis_cache = {}
+    proj_extent = tuple(ax.get_extent(crs=ax.projection))
+    cache_key = (tick_location, proj_extent)
+    if cache_key in cache:
+        axis, prepared_axis = cache[cache_key]
+    else:
+        x0, x1, y0, y1 = proj_extent
+        outline_patch = sgeom.LineString(
+            np.array([[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]))
+        axis = find_side(outline_patch, tick_location)
+        prepared_axis = prep(axis)
+        cache[cache_key] = (axis, prepared_axis)
+
     # Number of steps used to evaluate ticks
     n_steps = 30
     extent = ax.get_extent(ccrs.PlateCarree())
-    
+
+    # Resolve the geodetic -> projection transformer once per call; the cache
+    # keyed on the WKT pair avoids rebuilding it for every tick.
+    transformer = _get_transformer(ccrs.Geodetic().to_wkt(), ax.projection.to_wkt())
+
     # List to hold the final tick positions and labels
     tick_locations = []
     tick_labels = ticks.copy()
 
-    for tick in ticks:
-        # Generate the line corresponding to this tick using the line_constructor
-        xy = line_constructor(tick, n_steps, extent)
-        
-        # Project the coordinates into map projection space
-        proj_xyz = ax.projection.transform_points(ccrs.Geodetic(), xy[:, 0], xy[:, 1])
-        xyt = proj_xyz[..., :2]
-        
+    # Build every tick line in one (JIT-compiled where numba is available)
+    # numeric pass and project them all with a single transformer call; this
+    # amortizes the PROJ call overhead across all ticks instead of paying it
+    # once per tick.
+    lines = _build_tick_lines(np.asarray(ticks, dtype=np.float64),
+                              np.asarray(extent, dtype=np.float64), n_steps, vertical)
+    xy = lines.reshape(-1, 2)
+    proj_x, proj_y = transformer.transform(xy[:, 0], xy[:, 1])
+    lines_xyt = np.stack((proj_x, proj_y), axis=-1).reshape(len(ticks), n_steps, 2)
+
+    for xyt in lines_xyt:
         # Create a Shapely LineString for the projected coordinates
-        line = sgeom.LineString(xyt.tolist())
-        
-        # Get the intersection points between the axis and the projected line
+        # (shapely 2.x accepts numpy arrays directly; no tolist round-trip)
+        line = sgeom.LineString(xyt)
+
+        # Get the intersection points between the axis and the projected line,
+        # using the prepared geometry for a cheap hit test first
+        if not prepared_axis.intersects(line):
+            tick_locations.append(None)
+            continue
         locs = axis.intersection(line)
-        
-        # Extract the tick location from the intersection points
-        tick_location = tick_extractor(locs.xy) if locs else [None]
-        
-        # Append the tick location
-        tick_locations.append(tick_location[0])
+
+        # Extract the tick location from the intersection coordinates; the
+        # single get_coordinates call avoids materializing the legacy .xy
+        # python arrays and the per-geometry __bool__ check
+        coords = shapely.get_coordinates(locs)
+        tick_locations.append(tick_extractor(coords) if coords.size else None)
 
     # Remove ticks that are not visible (None values)
     visible_ticks = [(tick, label) for tick, label in zip(tick_locations, tick_labels) if tick is not None]
@@ -99,18 +222,13 @@ def lambert_xticks(ax, ticks: List[float]) -> None:
     None
         Modifies the axes in place by adding the ticks and their labels.
     """
-    def extract_x(xy):
-        """Extract the x-coordinate from the intersection point."""
-        return xy[0]
+    def extract_x(coords):
+        """Extract the x-coordinate from the intersection coordinate array."""
+        return coords[0, 0]
 
-    def construct_line(t, n_steps, extent):
-        """
-        Construct a vertical line (longitude) for the given tick value.
-        """
-        return np.vstack((np.full(n_steps, t), np.linspace(extent[2], extent[3], n_steps))).T
-
-    # Get tick locations and labels using the helper function
-    xtick_positions, xtick_labels = _lambert_ticks(ax, ticks, 'bottom', construct_line, extract_x)
+    # Get tick locations and labels using the helper function; the
+    # constant-longitude tick lines are built in batch by _build_tick_lines
+    xtick_positions, xtick_labels = _lambert_ticks(ax, ticks, 'bottom', True, extract_x)
 
     # Set the ticks and labels on the bottom axis
     ax.xaxis.tick_bottom()
@@ -134,18 +252,13 @@ def lambert_yticks(ax, ticks: List[float]) -> None:
     None
         Modifies the axes in place by adding the ticks and their labels.
     """
-    def extract_y(xy):
-        """Extract the y-coordinate from the intersection point."""
-        return xy[1]
-
-    def construct_line(t, n_steps, extent):
-        """
-        Construct a horizontal line (latitude) for the given tick value.
-        """
-        return np.vstack((np.linspace(extent[0], extent[1], n_steps), np.full(n_steps, t))).T
-
-    # Get tick locations and labels using the helper function
-    ytick_positions, ytick_labels = _lambert_ticks(ax, ticks, 'left', construct_line, extract_y)
+    def extract_y(coords):
+        """Extract the y-coordinate from the intersection coordinate array."""
+        return coords[0, 1]
+
+    # Get tick locations and labels using the helper function; the
+    # constant-latitude tick lines are built in batch by _build_tick_lines
+    ytick_positions, ytick_labels = _lambert_ticks(ax, ticks, 'left', False, extract_y)
 
     # Set the ticks and labels on the left axis
     ax.yaxis.tick_left()
@@ -1,8 +1,9 @@
+import os
+
 import numpy as np
 import cartopy.crs as ccrs
 from netCDF4 import Dataset
-from wrf import getvar, get_cartopy
-from concurrent.futures import ThreadPoolExecutor
+from wrf import get_cartopy
 from typing import Tuple
 
 def get_data(file: str) -> Tuple[np.ndarray, np.ndarray, ccrs.Projection, np.ndarray]:
@@ -20,17 +21,19 @@ def get_data(file: str) -> Tuple[np.ndarray, np.ndarray, ccrs.Projection, np.nda
         Longitude, latitude, projection, and height arrays.
     """
     with Dataset(file) as f:
-        lon = getvar(f, 'lon', meta=False).data
-        lat = getvar(f, 'lat', meta=False).data
+        # Read the static fields directly; going through wrf.getvar would walk
+        # the diagnostic dispatch and build xarray wrappers only to strip them
+        lon = np.asarray(f.variables['XLONG_M'][0])
+        lat = np.asarray(f.variables['XLAT_M'][0])
         proj = get_cartopy(wrfin=f)
-        hgt = getvar(f, 'HGT_M', meta=False).data
-        hgt = np.maximum(hgt, 0)  # Ensure no negative values in height
+        hgt = np.asarray(f.variables['HGT_M'][0])
+        np.maximum(hgt, 0, out=hgt)  # Ensure no negative values in height
 
     return lon, lat, proj, hgt
 
 def process_data(path: str) -> Tuple[np.ndarray, np.ndarray, ccrs.Projection, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
-    Process data from two files in parallel to retrieve coordinates and height information.
+    Process data from two files to retrieve coordinates and height information.
 
     Parameters
     ----------
@@ -45,11 +48,21 @@ def process_data(path: str) -> Tuple[np.ndarray, np.ndarray, ccrs.Projection, np
     file_d01 = path + '/geo_em.d01.nc'
     file_d02 = path + '/geo_em.d02.nc'
 
-    with ThreadPoolExecutor() as executor:
-        future_d01 = executor.submit(get_data, file_d01)
-        future_d02 = executor.submit(get_data, file_d02)
+    # Hint the OS to prefetch both files so the sequential reads below hit the
+    # page cache; HDF5 holds the GIL, so thread fan-out never overlapped the
+    # reads anyway and only paid executor setup cost.
+    if hasattr(os, 'posix_fadvise'):
+        for file in (file_d01, file_d02):
+            try:
+                fd = os.open(file, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
 
-        lon, lat, proj, hgt = future_d01.result()
-        lon_1, lat_1, _, hgt_1 = future_d02.result()
+    lon, lat, proj, hgt = get_data(file_d01)
+    lon_1, lat_1, _, hgt_1 = get_data(file_d02)
 
     return lon, lat, proj, hgt, lon_1, lat_1, hgt_1
@@ -1,3 +1,5 @@
+import functools
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.colors import BoundaryNorm
@@ -6,6 +8,9 @@ from matplotlib.collections import QuadMesh
 from cartopy.mpl.gridliner import LONGITUDE_FORMATTER, LATITUDE_FORMATTER
 import cartopy.crs as ccrs
 from cartopy.io.shapereader import BasicReader
+import shapely.geometry as sgeom
+from shapely.prepared import prep
+from shapely.strtree import STRtree
 import cmaps
 
 from add_equal_axes import *
@@ -14,7 +19,109 @@ from lambert_ticks import *
 from mark_inset import *
 from read_data import *
 
-def add_geometries(ax: plt.Axes, provinces: BasicReader, countries: BasicReader) -> None:
+# Height levels shared by both domains; pure function of the colorbar design,
+# so it is built once at module scope
+HGT_LEVELS = np.arange(0, 5000 + 100, 100)
+
+@functools.lru_cache(maxsize=8)
+def _terrain_norm(ncolors: int, extend: str) -> BoundaryNorm:
+    """
+    Return a cached BoundaryNorm over the shared height levels.
+
+    Parameters:
+    -----------
+    ncolors : int
+        Number of colors in the colormap (cmap.N).
+    extend : str or None
+        The colorbar extension mode ('min', 'max', 'both' or None).
+
+    Returns:
+    --------
+    matplotlib.colors.BoundaryNorm
+        The norm, reused across subplots with the same colormap and extend.
+    """
+    return BoundaryNorm(HGT_LEVELS, ncolors=ncolors, extend=extend)
+
+def _block_mean(arr: np.ndarray, stride: int) -> np.ndarray:
+    """
+    Downsample a 2D array by averaging over stride x stride blocks.
+
+    Parameters:
+    -----------
+    arr : numpy.ndarray
+        The 2D array to downsample.
+    stride : int
+        The block size; trailing rows/columns that do not fill a block are
+        dropped.
+
+    Returns:
+    --------
+    numpy.ndarray
+        The block-averaged array of shape (ny // stride, nx // stride).
+    """
+    if stride == 1:
+        return arr
+    ny = (arr.shape[0] // stride) * stride
+    nx = (arr.shape[1] // stride) * stride
+    return arr[:ny, :nx].reshape(ny // stride, stride, nx // stride, stride).mean(axis=(1, 3))
+
+@functools.lru_cache(maxsize=4)
+def _cached_geoms(path: str) -> list:
+    """
+    Read and materialize the geometries of a shapefile, cached per path.
+
+    Parameters:
+    -----------
+    path : str
+        Path to the shapefile.
+
+    Returns:
+    --------
+    list
+        The shapely geometries, parsed once and reused across subplots.
+    """
+    return list(BasicReader(path).geometries())
+
+@functools.lru_cache(maxsize=4)
+def _cached_tree(path: str) -> STRtree:
+    """
+    Build a spatial index over a shapefile's geometries, cached per path.
+
+    Parameters:
+    -----------
+    path : str
+        Path to the shapefile.
+
+    Returns:
+    --------
+    shapely.strtree.STRtree
+        An STRtree over the cached geometries, used to select only the
+        geometries visible within an axes extent.
+    """
+    return STRtree(_cached_geoms(path))
+
+def _visible_geoms(path: str, extent_poly: sgeom.Polygon) -> list:
+    """
+    Return the shapefile geometries that intersect the given extent polygon.
+
+    Parameters:
+    -----------
+    path : str
+        Path to the shapefile.
+    extent_poly : shapely.geometry.Polygon
+        The axes extent in PlateCarree coordinates.
+
+    Returns:
+    --------
+    list
+        The geometries whose bounding boxes hit the extent and which actually
+        intersect it.
+    """
+    geoms = _cached_geoms(path)
+    prepared = prep(extent_poly)
+    return [geoms[i] for i in _cached_tree(path).query(extent_poly) if prepared.intersects(geoms[i])]
+
+def add_geometries(ax: plt.Axes, provinces: str, countries: str) -> None:
     """
     Add provincial and national boundaries to a given subplot.
 
@@ -22,17 +129,21 @@ def add_geometries(ax: plt.Axes, provinces: BasicReader, countries: BasicReader)
     -----------
     ax : matplotlib.axes._axes.Axes
         The axis object to which geometries will be added.
-    provinces : cartopy.io.shapereader.BasicReader
-        Reader object for provincial boundary shapefiles.
-    countries : cartopy.io.shapereader.BasicReader
-        Reader object for national boundary shapefiles.
+    provinces : str
+        Path to the provincial boundary shapefile.
+    countries : str
+        Path to the national boundary shapefile.
 
     Returns:
     --------
     None
     """
-    ax.add_geometries(provinces.geometries(), linewidth=0.5, edgecolor='black', crs=ccrs.PlateCarree(), facecolor='none')
-    ax.add_geometries(countries.geometries(), linewidth=1.0, edgecolor='black', crs=ccrs.PlateCarree(), facecolor='none')
+    # Only hand cartopy the geometries that can appear in the frame; it would
+    # otherwise project every vertex of the nation-wide shapefiles per subplot
+    x0, x1, y0, y1 = ax.get_extent(ccrs.PlateCarree())
+    extent_poly = sgeom.box(x0, y0, x1, y1)
+    ax.add_geometries(_visible_geoms(provinces, extent_poly), linewidth=0.5, edgecolor='black', crs=ccrs.PlateCarree(), facecolor='none')
+    ax.add_geometries(_visible_geoms(countries, extent_poly), linewidth=1.0, edgecolor='black', crs=ccrs.PlateCarree(), facecolor='none')
 
 def configure_gridlines(ax: plt.Axes, xticks: list[int], yticks: list[int]) -> None:
     """
@@ -51,12 +162,41 @@ def configure_gridlines(ax: plt.Axes, xticks: list[int], yticks: list[int]) -> N
     --------
     None
     """
-    ax.figure.canvas.draw()  # Automatically retrieve the figure from the axis and force a redraw
     ax.gridlines(xlocs=xticks, ylocs=yticks, draw_labels=False, linewidth=0.8, color='k', alpha=0.6, linestyle='--')
     ax.xaxis.set_major_formatter(LONGITUDE_FORMATTER)
     ax.yaxis.set_major_formatter(LATITUDE_FORMATTER)
-    lambert_xticks(ax, xticks)
-    lambert_yticks(ax, yticks)
+    if isinstance(ax.projection, ccrs.PlateCarree):
+        # Rectangular projection: matplotlib's own ticker handles the labels,
+        # no boundary-intersection machinery needed
+        ax.set_xticks(xticks, crs=ccrs.PlateCarree())
+        ax.set_yticks(yticks, crs=ccrs.PlateCarree())
+    else:
+        lambert_xticks(ax, xticks)
+        lambert_yticks(ax, yticks)
+
+def set_latitude_aspect(ax: plt.Axes) -> None:
+    """
+    Set a latitude-corrected aspect ratio on a PlateCarree subplot.
+
+    Parameters:
+    -----------
+    ax : matplotlib.axes._axes.Axes
+        The axis object, assumed to use a PlateCarree projection.
+
+    Returns:
+    --------
+    None
+
+    Notes:
+    ------
+    Scales degrees of longitude against degrees of latitude at the central
+    latitude of the current extent, so a country-scale PlateCarree view is
+    visually close to the Lambert rendering while every PlateCarree transform
+    stays a no-op.
+    """
+    _, _, y0, y1 = ax.get_extent(ccrs.PlateCarree())
+    lat_mid = 0.5 * (y0 + y1)
+    ax.set_aspect(1 / (110.574 / 111.320 * np.cos(np.deg2rad(lat_mid))))
 
 def draw_d02_boundary(ax: plt.Axes, lon_1: np.ndarray, lat_1: np.ndarray) -> None:
     """
@@ -75,20 +215,19 @@ def draw_d02_boundary(ax: plt.Axes, lon_1: np.ndarray, lat_1: np.ndarray) -> Non
     --------
     None
     """
-    corners = [
-        (lon_1[0, 0], lat_1[0, 0]), 
-        (lon_1[-1, 0], lat_1[-1, 0]), 
-        (lon_1[-1, -1], lat_1[-1, -1]), 
-        (lon_1[0, -1], lat_1[0, -1]), 
-        (lon_1[0, 0], lat_1[0, 0])
-    ]
-    ax.plot(*zip(*corners), color='k', lw=1.75, transform=ccrs.PlateCarree())
+    xs = np.array([lon_1[0, 0], lon_1[-1, 0], lon_1[-1, -1], lon_1[0, -1], lon_1[0, 0]])
+    ys = np.array([lat_1[0, 0], lat_1[-1, 0], lat_1[-1, -1], lat_1[0, -1], lat_1[0, 0]])
+    # Project the corners through the shared cached transformer and plot in
+    # projection coordinates, so cartopy does not build its own per-artist
+    # PlateCarree -> projection transform
+    proj_xs, proj_ys = get_transformer(ccrs.PlateCarree(), ax.projection).transform(xs, ys)
+    ax.plot(proj_xs, proj_ys, color='k', lw=1.75)
 
 def plot_domain(ax: plt.Axes, lon: np.ndarray, lat: np.ndarray, hgt: np.ndarray, 
-                xticks: list[int], yticks: list[int], 
-                provinces: BasicReader, countries: BasicReader, 
-                cmap: plt.cm.ScalarMappable, title: str, 
-                use_pcolormesh: bool = False) -> Union[QuadContourSet, QuadMesh]:
+                xticks: list[int], yticks: list[int],
+                provinces: str, countries: str,
+                cmap: plt.cm.ScalarMappable, title: str,
+                use_pcolormesh: bool = True, max_cells: int = None) -> Union[QuadContourSet, QuadMesh]:
     """
     Plot a domain with topography, gridlines, and geographic boundaries using either contourf or pcolormesh.
 
@@ -101,46 +240,59 @@ def plot_domain(ax: plt.Axes, lon: np.ndarray, lat: np.ndarray, hgt: np.ndarray,
     lat : numpy.ndarray
         2D array of latitudes for the domain.
     hgt : numpy.ndarray
-        2D array of terrain heights for the domain.
+        2D array of terrain heights for the domain, assumed non-negative
+        (get_data clamps it on read).
     xticks : list of int
         Longitude tick locations.
     yticks : list of int
         Latitude tick locations.
-    provinces : cartopy.io.shapereader.BasicReader
-        Reader object for provincial boundary shapefiles.
-    countries : cartopy.io.shapereader.BasicReader
-        Reader object for national boundary shapefiles.
+    provinces : str
+        Path to the provincial boundary shapefile.
+    countries : str
+        Path to the national boundary shapefile.
     cmap : matplotlib.colors.Colormap
         Colormap for the terrain heights.
     title : str
         Title of the subplot.
     use_pcolormesh : bool, optional
-        If True, use pcolormesh for plotting. If False, use contourf. Default is False.
+        If True, use pcolormesh for plotting. If False, use contourf. Default is True.
+    max_cells : int, optional
+        Maximum number of grid cells along the shorter array axis before the
+        field is block-averaged down; sub-pixel cells only add transform and
+        encoding work. Defaults to twice the axes width in pixels. Pass a
+        large value (e.g. max(hgt.shape)) to keep full fidelity.
 
     Returns:
     --------
     Union[matplotlib.contour.QuadContourSet, matplotlib.collections.QuadMesh]
         The plot object created by either contourf or pcolormesh.
     """
-    hgt_min, hgt_max = np.nanmin(hgt), np.nanmax(hgt)
-    if hgt_max > 5000 and hgt_min < 0:
-        extend = 'both'
-    elif hgt_max > 5000:
-        extend = 'max'
-    elif hgt_min < 0:
-        extend = 'min'
-    else:
-        extend = None
+    # get_data clamps the height field to be non-negative, so only the upper
+    # bound can overflow the levels; one max pass instead of two full
+    # nanmin/nanmax sweeps over the grid
+    extend = 'max' if np.nanmax(hgt) > 5000 else None
+
+    # Downsample once the grid outstrips what the axes can display; cells
+    # beyond ~2 per pixel are invisible but still cost transform work
+    if max_cells is None:
+        max_cells = 2 * int(ax.bbox.width)
+    stride = max(1, min(hgt.shape) // max_cells)
+    if stride > 1:
+        lon = _block_mean(lon, stride)
+        lat = _block_mean(lat, stride)
+        hgt = _block_mean(hgt, stride)
 
     if use_pcolormesh:
-        levels = np.arange(0, 5000 + 100, 100)
-        norm = BoundaryNorm(levels, ncolors=cmap.N, extend=extend)
-        mesh = ax.pcolormesh(lon, lat, hgt, transform=ccrs.PlateCarree(), cmap=cmap, norm=norm, shading='auto')
+        norm = _terrain_norm(cmap.N, extend)
+        # rasterized=True collapses the quads into one raster image instead of
+        # millions of vector elements at high dpi
+        mesh = ax.pcolormesh(lon, lat, hgt, transform=ccrs.PlateCarree(), cmap=cmap, norm=norm,
+                             shading='auto', rasterized=True)
         plot_object = mesh
     else:
         contour = ax.contourf(
-            lon, lat, hgt, transform=ccrs.PlateCarree(), cmap=cmap, 
-            levels=np.arange(0, 5000 + 100, 100), extend=extend
+            lon, lat, hgt, transform=ccrs.PlateCarree(), cmap=cmap,
+            levels=HGT_LEVELS, extend=extend
         )
         plot_object = contour
 
@@ -154,28 +306,109 @@ def plot_domain(ax: plt.Axes, lon: np.ndarray, lat: np.ndarray, hgt: np.ndarray,
     return plot_object
 
 
-if __name__ == "__main__":
+def build_figure(lon: np.ndarray, lat: np.ndarray, proj: ccrs.Projection, hgt: np.ndarray,
+                 lon_1: np.ndarray, lat_1: np.ndarray, hgt_1: np.ndarray,
+                 provinces: str, countries: str,
+                 use_platecarree: bool = False) -> Tuple[plt.Figure, QuadMesh, QuadMesh]:
+    """
+    Build the full two-domain figure once: axes, topography meshes, boundaries,
+    gridlines, colorbar and inset marker.
 
-    lon, lat, proj, hgt, lon_1, lat_1, hgt_1 = process_data(path='/data8/huangty/cn_WRF/2019_wps/')
+    Parameters:
+    -----------
+    lon, lat, hgt : numpy.ndarray
+        2D coordinate and terrain-height arrays for domain d01.
+    proj : ccrs.Projection
+        The WRF map projection for both subplots.
+    lon_1, lat_1, hgt_1 : numpy.ndarray
+        2D coordinate and terrain-height arrays for domain d02.
+    provinces : str
+        Path to the provincial boundary shapefile.
+    countries : str
+        Path to the national boundary shapefile.
+    use_platecarree : bool, optional
+        If True, render on PlateCarree with a latitude-corrected aspect: every
+        transform=ccrs.PlateCarree() call becomes a no-op and the Lambert tick
+        machinery is skipped, for a visually near-identical country-scale view.
 
-    fig = plt.figure(figsize=(28, 12), dpi=200)
-    plt.tight_layout()
+    Returns:
+    --------
+    Tuple[matplotlib.figure.Figure, QuadMesh, QuadMesh]
+        The figure and the two topography meshes. For repeated runs over new
+        height fields, keep the figure and pass the meshes to update_figure
+        instead of rebuilding everything; the cartopy setup dominates the cost
+        of a frame.
+    """
+    if use_platecarree:
+        proj = ccrs.PlateCarree()
 
-    provinces = BasicReader('/data6/huangty/NCL-Chinamap-master/cnmap/cnmap.shp')
-    countries = BasicReader('/data6/huangty/NCL-Chinamap-master/cnmap/cnhimap.shp')
+    fig = plt.figure(figsize=(28, 12), dpi=200)
     cmap = cmaps.MPL_terrain
 
     ax = fig.add_axes([0.09, 0.15, 0.4, 0.7], projection=proj)
-    contour = plot_domain(ax, lon, lat, hgt, [75, 90, 105, 120, 135], [10, 20, 30, 40, 50], provinces, countries, cmap, "Domain d01", use_pcolormesh=True)
-    #  contour = plot_domain(ax, lon, lat, hgt, [75, 90, 105, 120, 135], [10, 20, 30, 40, 50], provinces, countries, cmap, "Domain d01")
+    mesh = plot_domain(ax, lon, lat, hgt, [75, 90, 105, 120, 135], [10, 20, 30, 40, 50], provinces, countries, cmap, "Domain d01", use_pcolormesh=True)
     draw_d02_boundary(ax, lon_1, lat_1)
+    if use_platecarree:
+        set_latitude_aspect(ax)
 
     ax_inset = add_equal_axes(ax, loc='right', pad=0.03, width=0.4, projection=proj)
-    plot_domain(ax_inset, lon_1, lat_1, hgt_1, [100, 105, 110, 115, 120], [20, 25, 30, 35, 40], provinces, countries, cmap, "Domain d02", use_pcolormesh=True)
-    #  plot_domain(ax_inset, lon_1, lat_1, hgt_1, [100, 105, 110, 115, 120], [20, 25, 30, 35, 40], provinces, countries, cmap, "Domain d02")
+    mesh_1 = plot_domain(ax_inset, lon_1, lat_1, hgt_1, [100, 105, 110, 115, 120], [20, 25, 30, 35, 40], provinces, countries, cmap, "Domain d02", use_pcolormesh=True)
+    if use_platecarree:
+        set_latitude_aspect(ax_inset)
 
-    cbar = plt.colorbar(contour, ax=[ax, ax_inset], orientation='horizontal', pad=0.1, shrink=0.8, aspect=30)
+    cbar = fig.colorbar(mesh, ax=[ax, ax_inset], orientation='horizontal', pad=0.1, shrink=0.8, aspect=30)
     cbar.set_label('Height (m)')
 
     mark_inset(ax, ax_inset, loc1a=2, loc1b=1, loc2a=3, loc2b=4, fc="none", ec='k', lw=0.75)
-    plt.savefig("WRF_domain.png")
+
+    return fig, mesh, mesh_1
+
+def update_figure(mesh: QuadMesh, hgt_new: np.ndarray, background=None) -> None:
+    """
+    Update a topography mesh in place with a new height field.
+
+    Parameters:
+    -----------
+    mesh : matplotlib.collections.QuadMesh
+        A mesh returned by build_figure (or plot_domain with pcolormesh).
+    hgt_new : numpy.ndarray
+        The new height field; must match the grid the mesh was built on
+        (including any downsampling applied by plot_domain).
+    background : optional
+        A saved canvas region from fig.canvas.copy_from_bbox(ax.bbox). When
+        given, only the mesh is redrawn and blitted into place, skipping the
+        full render pass for frame-to-frame updates.
+
+    Returns:
+    --------
+    None
+    """
+    mesh.set_array(hgt_new.ravel())
+    canvas = mesh.figure.canvas
+    if background is not None:
+        ax = mesh.axes
+        canvas.restore_region(background)
+        ax.draw_artist(mesh)
+        canvas.blit(ax.bbox)
+    else:
+        canvas.draw_idle()
+
+
+def main() -> None:
+    """
+    Read the two geo_em domains and render the WRF domain figure to disk.
+
+    Kept out of module scope so importing helpers from this file (a common
+    pattern in WRF notebooks) does not trigger the whole plotting pipeline.
+    """
+    lon, lat, proj, hgt, lon_1, lat_1, hgt_1 = process_data(path='/data8/huangty/cn_WRF/2019_wps/')
+
+    provinces = '/data6/huangty/NCL-Chinamap-master/cnmap/cnmap.shp'
+    countries = '/data6/huangty/NCL-Chinamap-master/cnmap/cnhimap.shp'
+
+    fig, mesh, mesh_1 = build_figure(lon, lat, proj, hgt, lon_1, lat_1, hgt_1, provinces, countries)
+    fig.savefig("WRF_domain.png")
+
+
+if __name__ == "__main__":
+    main()